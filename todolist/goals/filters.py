@@ -1,6 +1,10 @@
 import django_filters
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db import models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
 from django_filters import rest_framework
+from rest_framework import filters
 
 from goals.models import Goal
 
@@ -17,4 +21,28 @@ class GoalDateFilter(rest_framework.FilterSet):
 
     filter_overrides = {
         models.DateTimeField: {"filter_class": django_filters.IsoDateTimeFilter},
-    }
\ No newline at end of file
+    }
+
+
+class GoalSearchFilter(filters.SearchFilter):
+    """
+    Полнотекстовый поиск по Goal.search_vector (название, описание, комментарии).
+    Принимает тот же параметр ?search=, что и SearchFilter. Если сортировка не задана явно,
+    результаты упорядочены по релевантности.
+    """
+    # Должна совпадать с конфигурацией в триггере из миграции 0009_goal_search_vector
+    search_config = 'russian'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        query = SearchQuery(' '.join(terms), config=self.search_config, search_type='websearch')
+        # ts_rank возвращает real; приводим к double, чтобы значение без потерь попадало в курсор пагинации
+        queryset = queryset.filter(search_vector=query).annotate(
+            rank=Cast(SearchRank(F('search_vector'), query), FloatField())
+        )
+        if not request.query_params.get(filters.OrderingFilter.ordering_param):
+            queryset = queryset.order_by('-rank', '-id')
+        return queryset
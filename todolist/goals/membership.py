@@ -0,0 +1,47 @@
+from goals.models import BoardParticipant
+
+WRITE_ROLES = (BoardParticipant.Role.owner, BoardParticipant.Role.writer)
+
+
+class BoardMembership:
+    """
+    Роли пользователя на досках в виде {board_id: role}.
+    Загружается одним запросом при первом обращении и живёт в пределах запроса.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._roles: dict[int, int] | None = None
+
+    @property
+    def roles(self) -> dict[int, int]:
+        if self._roles is None:
+            if self.user is None or not self.user.is_authenticated:
+                self._roles = {}
+            else:
+                self._roles = dict(
+                    BoardParticipant.objects.filter(user_id=self.user.id).values_list('board_id', 'role')
+                )
+        return self._roles
+
+    @property
+    def board_ids(self) -> list[int]:
+        return list(self.roles)
+
+    def role(self, board_id: int) -> int | None:
+        return self.roles.get(board_id)
+
+    def has_role(self, board_id: int, roles=None) -> bool:
+        role = self.role(board_id)
+        return role is not None and (roles is None or role in roles)
+
+    def invalidate(self):
+        self._roles = None
+
+
+def get_membership(request) -> BoardMembership:
+    membership = getattr(request, '_board_membership', None)
+    if membership is None or membership.user != request.user:
+        membership = BoardMembership(request.user)
+        request._board_membership = membership
+    return membership
@@ -0,0 +1,77 @@
+# Generated by Django 4.0.1 on 2026-10-18 19:33
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Вектор собирается из названия (вес A), описания (B) и текстов всех комментариев цели (C).
+# Пересчитывается триггером при изменении title/description цели и при любом изменении комментариев,
+# поэтому остаётся актуальным и для массовых операций, которые обходят save()
+SEARCH_VECTOR_SQL = """
+CREATE OR REPLACE FUNCTION goals_goal_build_search_vector(bigint, text, text) RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('russian', coalesce($2, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce($3, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce(
+               (SELECT string_agg(c.text, ' ') FROM goals_goalcomment c WHERE c.goal_id = $1), ''
+           )), 'C')
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION goals_goal_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := goals_goal_build_search_vector(NEW.id, NEW.title, NEW.description);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goal_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, description ON goals_goal
+    FOR EACH ROW EXECUTE FUNCTION goals_goal_search_vector_trigger();
+
+CREATE OR REPLACE FUNCTION goals_goalcomment_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE goals_goal SET search_vector = goals_goal_build_search_vector(id, title, description)
+        WHERE id = OLD.goal_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND (TG_OP = 'INSERT' OR NEW.goal_id <> OLD.goal_id OR NEW.text <> OLD.text) THEN
+        UPDATE goals_goal SET search_vector = goals_goal_build_search_vector(id, title, description)
+        WHERE id = NEW.goal_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER goals_goalcomment_search_vector_update
+    AFTER INSERT OR UPDATE OF text, goal_id OR DELETE ON goals_goalcomment
+    FOR EACH ROW EXECUTE FUNCTION goals_goalcomment_search_vector_trigger();
+
+UPDATE goals_goal SET search_vector = goals_goal_build_search_vector(id, title, description);
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS goals_goalcomment_search_vector_update ON goals_goalcomment;
+DROP FUNCTION IF EXISTS goals_goalcomment_search_vector_trigger();
+DROP TRIGGER IF EXISTS goals_goal_search_vector_update ON goals_goal;
+DROP FUNCTION IF EXISTS goals_goal_search_vector_trigger();
+DROP FUNCTION IF EXISTS goals_goal_build_search_vector(bigint, text, text);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0008_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='goal',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='goal_search_vector_idx'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_SQL, DROP_SEARCH_VECTOR_SQL),
+    ]
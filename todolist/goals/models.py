@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from core.models import User
@@ -15,6 +17,10 @@ class Board(DatesModelMixin):
     class Meta:
         verbose_name = "Доска"
         verbose_name_plural = "Доски"
+        indexes = [
+            # board/list: WHERE NOT is_deleted ORDER BY title
+            models.Index(fields=["title", "id"], condition=models.Q(is_deleted=False), name="board_live_title_idx"),
+        ]
 
     title = models.CharField(verbose_name="Название", max_length=255)
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
@@ -25,6 +31,11 @@ class BoardParticipant(DatesModelMixin):
         unique_together = ("board", "user")
         verbose_name = "Участник"
         verbose_name_plural = "Участники"
+        indexes = [
+            # Проверка видимости во всех списках: participants.user_id = U [AND role IN (...)] -> board_id.
+            # unique_together даёт индекс (board_id, user_id), который не подходит для поиска по user_id
+            models.Index(fields=["user", "board", "role"], name="participant_user_board_idx"),
+        ]
 
     class Role(models.IntegerChoices):
         owner = 1, "Владелец"
@@ -52,6 +63,16 @@ class GoalCategory(DatesModelMixin):
     class Meta:
         verbose_name = "Категория"
         verbose_name_plural = "Категории"
+        indexes = [
+            # goal_category/list: board_id IN (доски пользователя) AND NOT is_deleted ORDER BY title | created
+            models.Index(
+                fields=["board", "title", "id"], condition=models.Q(is_deleted=False), name="category_live_title_idx"
+            ),
+            models.Index(
+                fields=["board", "-created", "-id"], condition=models.Q(is_deleted=False),
+                name="category_live_created_idx"
+            ),
+        ]
 
     board = models.ForeignKey(
         Board, verbose_name="Доска", on_delete=models.PROTECT, related_name="categories"
@@ -68,6 +89,29 @@ class Goal(DatesModelMixin):
     class Meta:
         verbose_name = "Цель"
         verbose_name_plural = "Цели"
+        # Все индексы частичные: архивные цели (status = 4, Goal.Status.archived) не попадают
+        # ни в goal/list, ни в goal/<pk>, поэтому в индексы не включаются
+        indexes = [
+            # goal/list: category_id IN (категории видимых досок) AND status <> 4 ORDER BY title
+            models.Index(
+                fields=["category", "title", "id"], condition=~models.Q(status=4), name="goal_live_title_idx"
+            ),
+            # goal/list?ordering=-created
+            models.Index(
+                fields=["category", "-created", "-id"], condition=~models.Q(status=4), name="goal_live_created_idx"
+            ),
+            # GoalDateFilter: category, status(__in), priority(__in)
+            models.Index(
+                fields=["category", "status", "priority"], condition=~models.Q(status=4), name="goal_live_status_idx"
+            ),
+            # GoalDateFilter: due_date__lte / due_date__gte
+            models.Index(
+                fields=["category", "due_date"], condition=~models.Q(status=4) & models.Q(due_date__isnull=False),
+                name="goal_live_due_date_idx"
+            ),
+            # goal/list?search=: search_vector @@ websearch_to_tsquery(...)
+            GinIndex(fields=["search_vector"], name="goal_search_vector_idx"),
+        ]
 
     class Status(models.IntegerChoices):
         to_do = 1, "К выполнению"
@@ -92,6 +136,8 @@ class Goal(DatesModelMixin):
     )
     category = models.ForeignKey(GoalCategory, verbose_name='Категория', on_delete=models.CASCADE, related_name='goals')
     user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.PROTECT, related_name='goals')
+    # Заполняется триггерами БД (см. миграцию 0009_goal_search_vector) из title, description и текстов комментариев
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
 
     def __str__(self):
         return self.title
@@ -105,6 +151,10 @@ class GoalComment(DatesModelMixin):
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+        indexes = [
+            # goal_comment/list: user_id = U ORDER BY created DESC
+            models.Index(fields=["user", "-created", "-id"], name="comment_user_created_idx"),
+        ]
 
     def __str__(self):
         return self.text
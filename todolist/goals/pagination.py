@@ -0,0 +1,181 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Постраничная выдача по ключу (keyset/cursor): курсор хранит значения
+    (поле сортировки, id) последней строки страницы, следующая страница
+    выбирается условием WHERE (field, id) > (value, id) по индексу.
+    Запрос COUNT(*) не выполняется, стоимость страницы не зависит от её номера.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.field, self.descending = self.get_ordering(queryset, view)
+        self.model = queryset.model
+        self.annotations = set(queryset.query.annotations)
+
+        cursor = self.decode_cursor(request)
+        self.reverse = bool(cursor and cursor['r'])
+
+        # Идём назад по выдаче – переворачиваем сортировку и направление сравнения
+        descending = self.descending != self.reverse
+        ordering = [self.order_expr(self.field, descending), self.order_expr('id', descending)]
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            queryset = queryset.filter(self.keyset_filter(cursor['v'], cursor['id'], descending))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if self.reverse:
+            rows.reverse()
+
+        self.page = rows
+        if self.reverse:
+            self.has_next, self.has_previous = cursor is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    @staticmethod
+    def order_expr(field: str, descending: bool) -> str:
+        return f'-{field}' if descending else field
+
+    def get_ordering(self, queryset, view) -> tuple[str, bool]:
+        ordering = list(queryset.query.order_by) or list(getattr(view, 'ordering', None) or [])
+        field = ordering[0] if ordering else 'id'
+        descending = field.startswith('-')
+        field = field.lstrip('-')
+        if field != 'id' and field not in queryset.query.annotations:
+            try:
+                queryset.model._meta.get_field(field)
+            except FieldDoesNotExist:
+                field, descending = 'id', False
+        return field, descending
+
+    def keyset_filter(self, value, pk, descending: bool) -> Q:
+        if self.field == 'id':
+            return Q(id__lt=pk) if descending else Q(id__gt=pk)
+        op = 'lt' if descending else 'gt'
+        return Q(**{f'{self.field}__{op}': value}) | Q(**{self.field: value, f'id__{op}': pk})
+
+    def get_value(self, row):
+        value = getattr(row, self.field)
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
+
+    def to_python(self, value):
+        if self.field == 'id' or self.field in self.annotations:
+            return value
+        try:
+            return self.model._meta.get_field(self.field).to_python(value)
+        except FieldDoesNotExist:
+            return value
+
+    def encode_cursor(self, row, reverse: bool) -> str:
+        payload = {'v': self.get_value(row), 'id': row.pk, 'r': int(reverse)}
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, base64.urlsafe_b64encode(raw).decode()
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            cursor = {'v': self.to_python(payload['v']), 'id': int(payload['id']), 'r': bool(payload['r'])}
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+
+class GoalsPagination(LimitOffsetPagination):
+    """
+    Пагинация списков целей, категорий, досок и комментариев.
+    С параметрами cursor/page_size работает по ключу (KeysetPagination),
+    иначе – прежний limit/offset с ограничением на размер страницы.
+    """
+    max_limit = KeysetPagination.max_page_size
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.keyset_requested(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def keyset_requested(self, request) -> bool:
+        return any(
+            param in request.query_params
+            for param in (self.keyset_class.cursor_query_param, self.keyset_class.page_size_query_param)
+        )
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_previous_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_previous_link()
+        return super().get_previous_link()
+
+    def get_next_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_next_link()
+        return super().get_next_link()
@@ -1,36 +1,37 @@
 from rest_framework import permissions
 
-from goals.models import BoardParticipant, GoalCategory, Goal, GoalComment
+from goals.membership import WRITE_ROLES, get_membership
+from goals.models import BoardParticipant, GoalCategory, Goal, GoalComment, Board
 
 
 class BoardPermissions(permissions.BasePermission):
-    def has_object_permission(self, request, view, obj: GoalCategory):
-        filters: dict = {'user': request.user, 'board': obj}
+    def has_object_permission(self, request, view, obj: Board):
+        roles = None
         if request.method not in permissions.SAFE_METHODS:
-            filters['role'] = BoardParticipant.Role.owner
+            roles = (BoardParticipant.Role.owner, )
 
-        return BoardParticipant.objects.filter(**filters).exists()
+        return get_membership(request).has_role(obj.id, roles)
 
 
 class GoalCategoryPermission(permissions.BasePermission):
     def has_object_permission(self, request, view, obj: GoalCategory):
-        filters: dict = {'user': request.user, 'board': obj.board}
+        roles = None
         if request.method not in permissions.SAFE_METHODS:
-            filters['role__in'] = [BoardParticipant.Role.owner, BoardParticipant.Role.writer]
+            roles = WRITE_ROLES
 
-        return BoardParticipant.objects.filter(**filters).exists()
+        return get_membership(request).has_role(obj.board_id, roles)
 
 
 class GoalPermissions(permissions.BasePermission):
     def has_object_permission(self, request, view, obj: Goal):
-        filters: dict = {'user': request.user, 'board': obj.category.board}
+        roles = None
         if request.method not in permissions.SAFE_METHODS:
-            filters['role__in'] = [BoardParticipant.Role.owner, BoardParticipant.Role.writer]
-        return BoardParticipant.objects.filter(**filters).exists()
+            roles = WRITE_ROLES
+        return get_membership(request).has_role(obj.category.board_id, roles)
 
 
 class CommentPermission(permissions.BasePermission):
     def has_object_permission(self, request, view, obj: GoalComment):
         return any((request.method in permissions.SAFE_METHODS,
                     obj.user_id == request.user.id,
-                    ))
\ No newline at end of file
+                    ))
@@ -1,5 +1,6 @@
 from django.db import transaction
 from rest_framework import serializers
+from goals.membership import WRITE_ROLES, get_membership
 from goals.models import GoalCategory, Goal, GoalComment, Board, BoardParticipant
 
 from core.serializers import ProfileSerializer
@@ -16,15 +17,12 @@ class GoalCreateCategorySerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created", "updated", "user", "is_deleted")
         fields = "__all__"
 
-    def validated_board(self, value: Board):
+    def validate_board(self, value: Board):
         if value.is_deleted:
             raise serializers.ValidationError("Now allowed to deleted category")
-        if not BoardParticipant.objects.filter(
-            board=value,
-            role__in = [BoardParticipant.Role.owner, BoardParticipant.Role.writer],
-            user = self.context['request'].user
-        ).exists():
+        if not get_membership(self.context['request']).has_role(value.id, WRITE_ROLES):
             raise serializers.ValidationError("You must be owner or writer")
+        return value
 
 
 class GoalCategorySerializer(serializers.ModelSerializer):
@@ -44,17 +42,13 @@ class GoalCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Goal
-        fields = '__all__'
+        exclude = ('search_vector', )
         read_only_fields = ("id", "created", "updated", "user")
 
     def validate_category(self, value):
         if self.context['request'].user != value.user:
             raise PermissionDenied
-        if not BoardParticipant.objects.filter(
-                board_id=value.board_id,
-                role__in=[BoardParticipant.Role.owner, BoardParticipant.Role.writer],
-                user=self.context['request'].user
-        ).exists():
+        if not get_membership(self.context['request']).has_role(value.board_id, WRITE_ROLES):
             raise PermissionDenied
         return value
 
@@ -66,7 +60,7 @@ class GoalSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Goal
-        fields = '__all__'
+        exclude = ('search_vector', )
         read_only_fields = ("id", "created", "updated", "user")
 
     def validate_category(self, value):
@@ -107,6 +101,7 @@ class BoardCreateSerializer(serializers.ModelSerializer):
         BoardParticipant.objects.create(
             user=user, board=board, role=BoardParticipant.Role.owner
         )
+        get_membership(self.context['request']).invalidate()
         return board
 
 
@@ -153,6 +148,7 @@ class BoardSerializer(serializers.ModelSerializer):
             instance.title = validated_data["title"]
             instance.save()
 
+        get_membership(self.context['request']).invalidate()
         return instance
 
 
@@ -11,7 +11,8 @@ from goals.serializers import GoalCreateSerializer,\
     GoalCommentSerializer, BoardSerializer, BoardListSerializer,\
     BoardCreateSerializer
 
-from goals.filters import GoalDateFilter
+from goals.filters import GoalDateFilter, GoalSearchFilter
+from goals.pagination import GoalsPagination
 from goals.permissions import BoardPermissions, GoalCategoryPermission,\
     GoalPermissions, CommentPermission
 
@@ -42,6 +43,7 @@ class BoardListView(ListAPIView):
     model = Board
     permission_classes = [permissions.IsAuthenticated, BoardPermissions]
     serializer_class = BoardListSerializer
+    pagination_class = GoalsPagination
     ordering_fields = ["title"]
     ordering = ["title"]
     search_fields = ["title"]
@@ -59,6 +61,7 @@ class GoalCategoryListView(ListAPIView):
     model = GoalCategory
     permission_classes = [permissions.IsAuthenticated, GoalCategoryPermission]
     serializer_class = GoalCategorySerializer
+    pagination_class = GoalsPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
@@ -105,15 +108,15 @@ class GoalListView(ListAPIView):
     model = Goal
     permission_classes = [permissions.IsAuthenticated, GoalPermissions]
     serializer_class = GoalSerializer
+    pagination_class = GoalsPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter,
+        GoalSearchFilter,
     ]
     filterset_class = GoalDateFilter
     ordering_fields = ["title", "created"]
     ordering = ["title"]
-    search_fields = ["title"]
 
     def get_queryset(self):
         return Goal.objects.select_related('user','category__board').filter(
@@ -146,6 +149,7 @@ class GoalCommentListView(ListAPIView):
     model = GoalComment
     permission_classes = [permissions.IsAuthenticated, CommentPermission]
     serializer_class = GoalCommentSerializer
+    pagination_class = GoalsPagination
     filter_backends = [
         filters.OrderingFilter,
     ]
@@ -0,0 +1,47 @@
+import pytest
+from django.urls import reverse
+
+from goals.membership import BoardMembership, WRITE_ROLES
+from goals.models import BoardParticipant, GoalCategory
+
+from tests.factories import BoardParticipantFactory
+
+
+@pytest.mark.django_db
+def test_membership_loads_roles_once(django_assert_num_queries, current_board_participant):
+    other = BoardParticipantFactory(user=current_board_participant.user, role=BoardParticipant.Role.reader)
+    membership = BoardMembership(current_board_participant.user)
+
+    with django_assert_num_queries(1):
+        assert membership.has_role(current_board_participant.board_id, WRITE_ROLES)
+        assert membership.has_role(other.board_id)
+        assert not membership.has_role(other.board_id, WRITE_ROLES)
+        assert membership.role(-1) is None
+
+
+@pytest.mark.django_db
+def test_membership_invalidate(django_assert_num_queries, current_board_participant):
+    membership = BoardMembership(current_board_participant.user)
+    assert membership.board_ids == [current_board_participant.board_id]
+
+    other = BoardParticipantFactory(user=current_board_participant.user)
+    membership.invalidate()
+
+    with django_assert_num_queries(1):
+        assert set(membership.board_ids) == {current_board_participant.board_id, other.board_id}
+
+
+@pytest.mark.django_db
+def test_create_category_reader_role(client, current_board_participant):
+    current_board_participant.role = BoardParticipant.Role.reader
+    current_board_participant.save()
+    client.force_login(user=current_board_participant.user)
+
+    response = client.post(
+        path=reverse('create-category'),
+        data={"title": "test_category", "board": current_board_participant.board_id},
+        content_type='application/json',
+    )
+
+    assert response.status_code == 400
+    assert not GoalCategory.objects.exists()
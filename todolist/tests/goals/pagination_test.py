@@ -0,0 +1,68 @@
+import pytest
+from django.urls import reverse
+
+from goals.models import Goal
+from goals.pagination import KeysetPagination
+
+from tests.factories import GoalFactory
+
+
+def walk(client, url):
+    ids, pages = [], []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.data)
+        ids.extend(item['id'] for item in response.data['results'])
+        url = response.data['next']
+    return ids, pages
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor_walks_all_rows(client, current_board_participant, current_user_category):
+    user = current_board_participant.user
+    GoalFactory.create_batch(size=3, user=user, category=current_user_category, title='same title')
+    GoalFactory.create_batch(size=4, user=user, category=current_user_category)
+    client.force_login(user=user)
+
+    ids, pages = walk(client, reverse('list-goals') + '?page_size=3')
+
+    expected = list(Goal.objects.order_by('title', 'id').values_list('id', flat=True))
+    assert ids == expected
+    assert len(pages) == 3
+    assert pages[0]['previous'] is None
+    assert 'count' not in pages[0]
+
+
+@pytest.mark.django_db
+def test_goal_list_cursor_previous_link(client, current_board_participant, current_user_goals):
+    client.force_login(user=current_board_participant.user)
+
+    first = client.get(reverse('list-goals') + '?page_size=2&ordering=-created').data
+    second = client.get(first['next']).data
+    back = client.get(second['previous']).data
+
+    expected = list(Goal.objects.order_by('-created', '-id').values_list('id', flat=True))
+    assert [item['id'] for item in first['results'] + second['results']] == expected[:4]
+    assert back['results'] == first['results']
+    assert back['previous'] is None
+
+
+@pytest.mark.django_db
+def test_category_list_page_size_is_capped(client, current_board_participant, current_user_categories):
+    client.force_login(user=current_board_participant.user)
+
+    response = client.get(reverse('list-category') + '?page_size=100000')
+
+    assert response.status_code == 200
+    assert len(response.data['results']) == 4
+    assert KeysetPagination().get_page_size(response.renderer_context['request']) == KeysetPagination.max_page_size
+
+
+@pytest.mark.django_db
+def test_goal_list_invalid_cursor(client, current_board_participant):
+    client.force_login(user=current_board_participant.user)
+
+    response = client.get(reverse('list-goals') + '?cursor=broken')
+
+    assert response.status_code == 404
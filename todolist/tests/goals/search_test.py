@@ -0,0 +1,66 @@
+import pytest
+from django.urls import reverse
+
+from goals.models import GoalComment
+
+from tests.factories import GoalFactory
+
+
+@pytest.mark.django_db
+def test_goal_search_by_title_description_and_comments(client, current_board_participant, current_user_category):
+    user = current_board_participant.user
+    in_title = GoalFactory(user=user, category=current_user_category, title='Купить молоко', description='')
+    in_description = GoalFactory(user=user, category=current_user_category, title='Магазин', description='молоко и хлеб')
+    in_comment = GoalFactory(user=user, category=current_user_category, title='Завтрак', description='')
+    GoalComment.objects.create(user=user, goal=in_comment, text='не забыть молоко')
+    GoalFactory(user=user, category=current_user_category, title='Спорт', description='бег')
+    client.force_login(user=user)
+
+    response = client.get(reverse('list-goals') + '?search=молоко')
+
+    assert response.status_code == 200
+    assert [goal['id'] for goal in response.data] == [in_title.id, in_description.id, in_comment.id]
+
+
+@pytest.mark.django_db
+def test_goal_search_uses_stemming(client, current_board_participant, current_user_category):
+    user = current_board_participant.user
+    goal = GoalFactory(user=user, category=current_user_category, title='Прочитать книги')
+    client.force_login(user=user)
+
+    response = client.get(reverse('list-goals') + '?search=книга')
+
+    assert [item['id'] for item in response.data] == [goal.id]
+
+
+@pytest.mark.django_db
+def test_goal_search_vector_follows_comment_changes(client, current_board_participant, current_user_goal):
+    user = current_board_participant.user
+    comment = GoalComment.objects.create(user=user, goal=current_user_goal, text='созвон')
+    client.force_login(user=user)
+    url = reverse('list-goals') + '?search=созвон'
+
+    assert [item['id'] for item in client.get(url).data] == [current_user_goal.id]
+
+    comment.delete()
+
+    assert client.get(url).data == []
+
+
+@pytest.mark.django_db
+def test_goal_search_cursor_pagination_keeps_rank_order(client, current_board_participant, current_user_category):
+    user = current_board_participant.user
+    goals = [
+        GoalFactory(user=user, category=current_user_category, title='отчёт отчёт', description=''),
+        GoalFactory(user=user, category=current_user_category, title='отчёт', description=''),
+        GoalFactory(user=user, category=current_user_category, title='Задача', description='отчёт'),
+    ]
+    client.force_login(user=user)
+
+    response = client.get(reverse('list-goals'), {'search': 'отчёт', 'page_size': 1})
+    ids = [item['id'] for item in response.data['results']]
+    while response.data['next']:
+        response = client.get(response.data['next'])
+        ids.extend(item['id'] for item in response.data['results'])
+
+    assert ids == [goal.id for goal in goals]